@@ -34,6 +34,11 @@ DEVICE_TYPE_HUMIDITY = "humidity"
 DEVICE_TYPE_WEATHER = "weather"
 DEVICE_TYPE_DISTANCE = "distance"
 
+# Unit conversion factors
+MS_TO_KMH = 3.6
+MS_TO_MPH = 2.23693629
+MM_TO_INCH = 0.03937007874
+
 TYPE_SENSOR = "sensor"
 TYPE_FORECAST = "forecast"
 TYPE_ALERT = "alert"
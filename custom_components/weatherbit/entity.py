@@ -33,14 +33,9 @@ class WeatherbitEntity(Entity):
             f"{self.entries[CONF_LATITUDE]}_{self.entries[CONF_LONGITUDE]}"
         )
         if self._entity == DEVICE_TYPE_WEATHER:
-            self._unique_id = self._device_key
+            self._attr_unique_id = self._device_key
         else:
-            self._unique_id = f"{self._device_key}_{self._entity}"
-
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return self._unique_id
+            self._attr_unique_id = f"{self._device_key}_{self._entity}"
 
     @property
     def _forecast(self):
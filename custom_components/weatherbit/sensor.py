@@ -3,21 +3,20 @@
 import logging
 from typing import Dict, List
 
-from homeassistant.helpers.entity import Entity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.typing import HomeAssistantType
-from homeassistant.util.pressure import convert as convert_pressure
-from homeassistant.util.distance import convert as convert_distance
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import (
     ATTR_ATTRIBUTION,
-    LENGTH_METERS,
-    LENGTH_MILES,
-    LENGTH_KILOMETERS,
-    PRESSURE_HPA,
-    PRESSURE_INHG,
-    TEMP_CELSIUS,
+    PERCENTAGE,
     SUN_EVENT_SUNSET,
     SUN_EVENT_SUNRISE,
+    UnitOfLength,
+    UnitOfPrecipitationDepth,
+    UnitOfPressure,
+    UnitOfSpeed,
+    UnitOfTemperature,
+    UnitOfVolumetricFlux,
 )
 from homeassistant.components.weather import (
     ATTR_FORECAST_CONDITION,
@@ -38,6 +37,9 @@ from .const import (
     ATTR_WEATHERBIT_WEATHER_ICON,
     ATTR_WEATHERBIT_SNOW,
     DEFAULT_ATTRIBUTION,
+    MM_TO_INCH,
+    MS_TO_KMH,
+    MS_TO_MPH,
     DEVICE_TYPE_TEMPERATURE,
     DEVICE_TYPE_WIND,
     DEVICE_TYPE_HUMIDITY,
@@ -45,9 +47,6 @@ from .const import (
     DEVICE_TYPE_SNOW,
     DEVICE_TYPE_PRESSURE,
     DEVICE_TYPE_DISTANCE,
-    TYPE_SENSOR,
-    TYPE_FORECAST,
-    TYPE_ALERT,
     CONDITION_CLASSES,
     CONF_ADD_SENSORS,
 )
@@ -76,15 +75,114 @@ SENSORS = {
     "snow": ["Snow", DEVICE_TYPE_SNOW, "weather-snowy-heavy"],
 }
 
+# Device Class and native (metric) unit for each Weatherbit device type.
+# Home Assistant converts to the display unit. Existing entities keep their
+# registered unit when Home Assistant can convert to it.
+SENSOR_UNITS = {
+    DEVICE_TYPE_TEMPERATURE: [SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS],
+    DEVICE_TYPE_WIND: [SensorDeviceClass.SPEED, UnitOfSpeed.METERS_PER_SECOND],
+    DEVICE_TYPE_HUMIDITY: [SensorDeviceClass.HUMIDITY, PERCENTAGE],
+    DEVICE_TYPE_PRESSURE: [SensorDeviceClass.PRESSURE, UnitOfPressure.HPA],
+    DEVICE_TYPE_DISTANCE: [SensorDeviceClass.DISTANCE, UnitOfLength.KILOMETERS],
+    DEVICE_TYPE_RAIN: [
+        SensorDeviceClass.PRECIPITATION,
+        UnitOfPrecipitationDepth.MILLIMETERS,
+    ],
+    DEVICE_TYPE_SNOW: [
+        SensorDeviceClass.PRECIPITATION_INTENSITY,
+        UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR,
+    ],
+}
+
+# Display units for imperial systems where Home Assistant's own unit system
+# conversion does not give the units these sensors used before.
+IMPERIAL_UNITS = {
+    DEVICE_TYPE_PRESSURE: UnitOfPressure.INHG,
+    DEVICE_TYPE_SNOW: UnitOfVolumetricFlux.INCHES_PER_HOUR,
+}
+
 ALERTS = {
     "weather_alerts": ["Weather Alerts", "", "alert"],
 }
 
+
+def _identity(value):
+    """Return the value unchanged."""
+    return value
+
+
+def _round_1(value):
+    """Return the value rounded to one decimal."""
+    return round(value, 1)
+
+
+def _invert_conditions(condition_classes):
+    """Return a weather code to condition map.
+
+    A code listed under more than one condition keeps the first one.
+    """
+    code_to_condition = {}
+    for condition, codes in condition_classes.items():
+        for code in codes:
+            code_to_condition.setdefault(code, condition)
+    return code_to_condition
+
+
+_CODE_TO_CONDITION = _invert_conditions(CONDITION_CLASSES)
+
+# Conditions where the mdi icon name differs from the condition.
+_CONDITION_ICONS = {
+    "partlycloudy": "partly-cloudy",
+}
+
+# State conversion for each Weatherbit device type, selected once per sensor.
+_STATE_FNS = {
+    DEVICE_TYPE_WIND: _round_1,
+    DEVICE_TYPE_RAIN: _round_1,
+    DEVICE_TYPE_SNOW: _round_1,
+    "UVI": _round_1,
+}
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _scale(value, factor, ndigits, offset=0):
+    """Return value * factor + offset rounded, or None if there is no value."""
+    if value is None:
+        return None
+    return round(value * factor + offset, ndigits)
+
+
+def _convert_forecast_metric(data):
+    """Return metric temperatures, wind, rain and snow for each forecast day."""
+    return [
+        (
+            day.max_temp,
+            day.min_temp,
+            _scale(day.wind_spd, MS_TO_KMH, 1),
+            _scale(day.precip, 1, 1),
+            _scale(day.snow, 1, 1),
+        )
+        for day in data
+    ]
+
+
+def _convert_forecast_imperial(data):
+    """Return imperial temperatures, wind, rain and snow for each forecast day."""
+    return [
+        (
+            _scale(day.max_temp, 1.8, 1, 32),
+            _scale(day.min_temp, 1.8, 1, 32),
+            _scale(day.wind_spd, MS_TO_MPH, 1),
+            _scale(day.precip, MM_TO_INCH, 2),
+            _scale(day.snow, MM_TO_INCH, 2),
+        )
+        for day in data
+    ]
+
+
 async def async_setup_entry(
-    hass: HomeAssistantType, entry: ConfigEntry, async_add_entities
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ) -> None:
     """Setup the Weatherbit sensor platform."""
 
@@ -106,55 +204,66 @@ async def async_setup_entry(
 
     alert_coordinator = hass.data[DOMAIN][entry.entry_id]["alert_coordinator"]
 
+    is_metric = hass.config.units.is_metric
+    entry_data = entry.data
     sensors = []
 
     # Add Sensors if selected in Config
-    if entry.data[CONF_ADD_SENSORS]:
-        for sensor in SENSORS:
-            sensors.append(
-                WeatherbitSensor(
-                    fcst_coordinator,
-                    cur_coordinator,
-                    alert_coordinator,
-                    entry.data,
-                    sensor,
-                    hass.config.units.is_metric,
-                    TYPE_SENSOR,
-                    0,
-                )
+    if entry_data[CONF_ADD_SENSORS]:
+        sensors = [
+            WeatherbitCurrentSensor(
+                fcst_coordinator,
+                cur_coordinator,
+                alert_coordinator,
+                entry_data,
+                sensor,
+                is_metric,
             )
-        cnt = 0
-
-        for forecast in fcst_coordinator.data[:7]:
-            sensors.append(
-                WeatherbitSensor(
-                    fcst_coordinator,
-                    cur_coordinator,
-                    alert_coordinator,
-                    entry.data,
-                    forecast,
-                    hass.config.units.is_metric,
-                    TYPE_FORECAST,
-                    cnt,
-                )
+            for sensor in SENSORS
+        ]
+
+        # Convert the forecast days once per refresh, shared by all forecast sensors
+        if is_metric:
+            convert_forecast = _convert_forecast_metric
+        else:
+            convert_forecast = _convert_forecast_imperial
+
+        converted_forecast = []
+
+        @callback
+        def _async_convert_forecast():
+            if fcst_coordinator.data:
+                converted_forecast[:] = convert_forecast(fcst_coordinator.data[:7])
+
+        _async_convert_forecast()
+        entry.async_on_unload(
+            fcst_coordinator.async_add_listener(_async_convert_forecast)
+        )
+
+        sensors += [
+            WeatherbitForecastSensor(
+                fcst_coordinator,
+                cur_coordinator,
+                alert_coordinator,
+                entry_data,
+                index,
+                converted_forecast,
             )
-            cnt += 1
+            for index in range(min(len(fcst_coordinator.data), 7))
+        ]
 
     # Add alerts if selected in Config
     if alert_coordinator is not None:
-        for sensor in ALERTS:
-            sensors.append(
-                WeatherbitSensor(
-                    fcst_coordinator,
-                    cur_coordinator,
-                    alert_coordinator,
-                    entry.data,
-                    sensor,
-                    hass.config.units.is_metric,
-                    TYPE_ALERT,
-                    0,
-                )
+        sensors += [
+            WeatherbitAlertSensor(
+                fcst_coordinator,
+                cur_coordinator,
+                alert_coordinator,
+                entry_data,
+                sensor,
             )
+            for sensor in ALERTS
+        ]
     if sensors != []:
         async_add_entities(sensors, True)
     else:
@@ -163,8 +272,8 @@ async def async_setup_entry(
     return True
 
 
-class WeatherbitSensor(WeatherbitEntity, Entity):
-    """Implementation of Weatherbit sensor."""
+class WeatherbitCurrentSensor(WeatherbitEntity, SensorEntity):
+    """Implementation of a Weatherbit current conditions sensor."""
 
     def __init__(
         self,
@@ -174,126 +283,159 @@ class WeatherbitSensor(WeatherbitEntity, Entity):
         entries,
         sensor,
         is_metric,
-        sensor_type,
-        index,
     ):
         """Initialize Weatherbit sensor."""
         super().__init__(
             fcst_coordinator, cur_coordinator, alert_coordinator, entries, sensor
         )
         self._sensor = sensor
-        self._sensor_type = sensor_type
-        self._is_metric = is_metric
-        self._index = index
-
-        if self._sensor_type == TYPE_SENSOR:
-            self._name = f"{DOMAIN.capitalize()} {SENSORS[self._sensor][0]}"
-            self._unique_id = f"{self._device_key}_{self._sensor}"
-            self._device_class = SENSORS[self._sensor][1]
-        elif self._sensor_type == TYPE_ALERT:
-            self._name = f"{DOMAIN.capitalize()} {ALERTS[self._sensor][0]}"
-            self._unique_id = f"{self._device_key}_{self._sensor}"
-            self._device_class = ALERTS[self._sensor][1]
+        self._attr_name = f"{DOMAIN.capitalize()} {SENSORS[self._sensor][0]}"
+        self._attr_icon = f"mdi:{SENSORS[self._sensor][2]}"
+        self._device_class = SENSORS[self._sensor][1]
+        if self._device_class in SENSOR_UNITS:
+            (
+                self._attr_device_class,
+                self._attr_native_unit_of_measurement,
+            ) = SENSOR_UNITS[self._device_class]
+        elif self._device_class != "":
+            self._attr_native_unit_of_measurement = self._device_class
+        if not is_metric and self._device_class in IMPERIAL_UNITS:
+            self._attr_suggested_unit_of_measurement = IMPERIAL_UNITS[
+                self._device_class
+            ]
+        self._state_fn = _STATE_FNS.get(self._device_class, _identity)
+        if self._sensor == "solar_rad":
+            self._attrs_fn = self._solar_attributes
         else:
-            self._name = f"{DOMAIN.capitalize()} Forecast Day {self._index + 1}"
-            self._unique_id = f"{self._device_key}_forecast_day{self._index + 1}"
-            self._device_class = ""
-            self._condition = next(
-                (
-                    k
-                    for k, v in CONDITION_CLASSES.items()
-                    if getattr(self.fcst_coordinator.data[self._index], "weather_code")
-                    in v
-                ),
-                None,
-            )
-            if self._condition == "partlycloudy":
-                self._weather_icon = "partly-cloudy"
-            else:
-                self._weather_icon = self._condition
+            self._attrs_fn = self._sensor_attributes
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self._state_fn(getattr(self._current, self._sensor))
 
     @property
-    def name(self):
-        """Return the name of the sensor."""
-        return self._name
+    def extra_state_attributes(self):
+        """Return Weatherbit specific attributes."""
+        return self._attrs_fn()
+
+    def _sensor_attributes(self):
+        """Return attributes for a current conditions sensor."""
+        return {
+            ATTR_ATTRIBUTION: DEFAULT_ATTRIBUTION,
+            ATTR_WEATHERBIT_UPDATED: self._current.obs_time_local,
+        }
+
+    def _solar_attributes(self):
+        """Return attributes for the Solar Radiation sensor."""
+        current = self._current
+        return {
+            ATTR_ATTRIBUTION: DEFAULT_ATTRIBUTION,
+            ATTR_WEATHERBIT_UPDATED: current.obs_time_local,
+            "dhi": current.dhi,
+            "dni": current.dni,
+            "ghi": current.ghi,
+            "elev_angle": current.elev_angle,
+            "h_angle": current.h_angle,
+            SUN_EVENT_SUNRISE: current.sunrise,
+            SUN_EVENT_SUNSET: current.sunset,
+        }
+
+
+class WeatherbitForecastSensor(WeatherbitEntity, SensorEntity):
+    """Implementation of a Weatherbit forecast day sensor."""
+
+    def __init__(
+        self,
+        fcst_coordinator,
+        cur_coordinator,
+        alert_coordinator,
+        entries,
+        index,
+        converted_forecast,
+    ):
+        """Initialize Weatherbit forecast sensor."""
+        super().__init__(
+            fcst_coordinator,
+            cur_coordinator,
+            alert_coordinator,
+            entries,
+            f"forecast_day{index + 1}",
+        )
+        self._index = index
+        self._converted_forecast = converted_forecast
+        self._attr_name = f"{DOMAIN.capitalize()} Forecast Day {self._index + 1}"
+        self._attrs_cache_key = None
+        self._attrs_cache = None
+        self._condition = _CODE_TO_CONDITION.get(
+            getattr(self.fcst_coordinator.data[self._index], "weather_code")
+        )
+        weather_icon = _CONDITION_ICONS.get(self._condition, self._condition)
+        self._attr_icon = f"mdi:weather-{weather_icon}"
 
     @property
-    def state(self):
+    def native_value(self):
         """Return the state of the sensor."""
-        if self._sensor_type == TYPE_SENSOR:
-            value = getattr(self._current, self._sensor)
-            if self._device_class == DEVICE_TYPE_WIND:
-                if self._is_metric:
-                    return round(value, 1)
-                else:
-                    return round(float(value * 2.23693629), 2)
-            elif self._device_class == DEVICE_TYPE_PRESSURE:
-                if self._is_metric:
-                    return value
-                else:
-                    return round(
-                        convert_pressure(value, PRESSURE_HPA, PRESSURE_INHG), 2
-                    )
-            elif (
-                self._device_class == DEVICE_TYPE_RAIN
-                or self._device_class == DEVICE_TYPE_SNOW
-            ):
-                if self._is_metric:
-                    return round(float(value), 1)
-                else:
-                    return round(float(value) / 25.4, 2)
-            elif self._device_class == DEVICE_TYPE_DISTANCE:
-                if self._is_metric:
-                    return value
-                else:
-                    return int(
-                        float(convert_distance(value, LENGTH_KILOMETERS, LENGTH_MILES))
-                    )
-            elif self._device_class == "UVI":
-                return round(float(value), 1)
-            else:
-                return value
-        elif self._sensor_type == TYPE_ALERT:
-            return getattr(self._alerts, "alert_count")
-        else:
-            return self._condition
+        return self._condition
 
     @property
-    def icon(self):
-        """Return icon for sensor."""
-        if self._sensor_type == TYPE_SENSOR:
-            return f"mdi:{SENSORS[self._sensor][2]}"
-        elif self._sensor_type == TYPE_ALERT:
-            return f"mdi:{ALERTS[self._sensor][2]}"
-        else:
-            return f"mdi:weather-{self._weather_icon}"
+    def extra_state_attributes(self):
+        """Return Weatherbit specific attributes."""
+        data = self.fcst_coordinator.data
+        # The coordinator replaces the data list on each refresh
+        if self._attrs_cache_key is data:
+            return self._attrs_cache
+        self._attrs_cache_key = data
+
+        index = self._index
+        if index >= len(data):
+            self._attrs_cache = None
+            return None
+        fcst = data[index]
+        temp, tempmin, wspeed, precip, snow = self._converted_forecast[index]
+
+        self._attrs_cache = {
+            ATTR_ATTRIBUTION: DEFAULT_ATTRIBUTION,
+            ATTR_FORECAST_TIME: fcst.local_time,
+            ATTR_FORECAST_TEMP: temp,
+            ATTR_FORECAST_TEMP_LOW: tempmin,
+            ATTR_FORECAST_PRECIPITATION: precip,
+            ATTR_WEATHERBIT_SNOW: snow,
+            ATTR_WEATHERBIT_CLOUDINESS: fcst.clouds,
+            ATTR_WEATHERBIT_FCST_POP: fcst.pop,
+            ATTR_FORECAST_WIND_SPEED: wspeed,
+            ATTR_FORECAST_WIND_BEARING: fcst.wind_dir,
+            ATTR_WEATHERBIT_WEATHER_TEXT: fcst.weather_text,
+            ATTR_WEATHERBIT_WEATHER_ICON: fcst.weather_icon,
+        }
+        return self._attrs_cache
+
+
+class WeatherbitAlertSensor(WeatherbitEntity, SensorEntity):
+    """Implementation of the Weatherbit Weather Alerts sensor."""
+
+    def __init__(
+        self,
+        fcst_coordinator,
+        cur_coordinator,
+        alert_coordinator,
+        entries,
+        sensor,
+    ):
+        """Initialize Weatherbit alert sensor."""
+        super().__init__(
+            fcst_coordinator, cur_coordinator, alert_coordinator, entries, sensor
+        )
+        self._attr_name = f"{DOMAIN.capitalize()} {ALERTS[sensor][0]}"
+        self._attr_icon = f"mdi:{ALERTS[sensor][2]}"
 
     @property
-    def unit_of_measurement(self):
-        """Return the units of measurement."""
-        if self._sensor_type == TYPE_SENSOR:
-            if self._device_class == DEVICE_TYPE_TEMPERATURE:
-                return TEMP_CELSIUS
-            elif self._device_class == DEVICE_TYPE_WIND:
-                return "m/s" if self._is_metric else "mph"
-            elif self._device_class == DEVICE_TYPE_PRESSURE:
-                return "hPa" if self._is_metric else "inHg"
-            elif self._device_class == DEVICE_TYPE_HUMIDITY:
-                return "%"
-            elif self._device_class == DEVICE_TYPE_RAIN:
-                return "mm" if self._is_metric else "in"
-            elif self._device_class == DEVICE_TYPE_SNOW:
-                return "mm/hr" if self._is_metric else "in/hr"
-            elif self._device_class == DEVICE_TYPE_DISTANCE:
-                return "km" if self._is_metric else "mi"
-            else:
-                return self._device_class
+    def native_value(self):
+        """Return the state of the sensor."""
+        return getattr(self._alerts, "alert_count")
 
     @property
     def alerts(self) -> List:
-        if self._sensor_type != TYPE_ALERT:
-            return
-
         if self.alert_coordinator.data is None:
             return None
 
@@ -314,85 +456,9 @@ class WeatherbitSensor(WeatherbitEntity, Entity):
         return alert_data
 
     @property
-    def device_state_attributes(self):
+    def extra_state_attributes(self):
         """Return Weatherbit specific attributes."""
-        if self._sensor_type == TYPE_SENSOR:
-            if self._sensor == "solar_rad":
-                return {
-                    ATTR_ATTRIBUTION: DEFAULT_ATTRIBUTION,
-                    ATTR_WEATHERBIT_UPDATED: getattr(self._current, "obs_time_local"),
-                    "dhi": getattr(self._current, "dhi"),
-                    "dni": getattr(self._current, "dni"),
-                    "ghi": getattr(self._current, "ghi"),
-                    "elev_angle": getattr(self._current, "elev_angle"),
-                    "h_angle": getattr(self._current, "h_angle"),
-                    SUN_EVENT_SUNRISE: getattr(self._current, "sunrise"),
-                    SUN_EVENT_SUNSET: getattr(self._current, "sunset"),
-                }
-            else:
-                return {
-                    ATTR_ATTRIBUTION: DEFAULT_ATTRIBUTION,
-                    ATTR_WEATHERBIT_UPDATED: getattr(self._current, "obs_time_local"),
-                }
-        elif self._sensor_type == TYPE_ALERT:
-            return {
-                ATTR_ATTRIBUTION: DEFAULT_ATTRIBUTION,
-                ATTR_WEATHERBIT_ALERTS: self.alerts,
-            }
-        else:
-            _temp = getattr(self.fcst_coordinator.data[self._index], "max_temp")
-            if self._is_metric:
-                temp = _temp
-            else:
-                temp = round(float((_temp * 1.8) + 32), 1)
-
-            _tempmin = getattr(self.fcst_coordinator.data[self._index], "min_temp")
-            if self._is_metric:
-                tempmin = _tempmin
-            else:
-                tempmin = round(float((_tempmin * 1.8) + 32), 1)
-
-            _wspeed = getattr(self.fcst_coordinator.data[self._index], "wind_spd")
-            if self._is_metric:
-                wspeed = round(float(_wspeed) * 3.6, 1)
-            else:
-                wspeed = round(float(_wspeed * 2.23693629), 1)
-
-            _precip = getattr(self.fcst_coordinator.data[self._index], "precip")
-            if self._is_metric:
-                precip = round(float(_precip), 1)
-            else:
-                precip = round(float(_precip) / 25.4, 2)
-
-            _snow = getattr(self.fcst_coordinator.data[self._index], "snow")
-            if self._is_metric:
-                snow = round(float(_snow), 1)
-            else:
-                snow = round(float(_snow) / 25.4, 2)
-
-            return {
-                ATTR_ATTRIBUTION: DEFAULT_ATTRIBUTION,
-                ATTR_FORECAST_TIME: getattr(
-                    self.fcst_coordinator.data[self._index], "local_time"
-                ),
-                ATTR_FORECAST_TEMP: temp,
-                ATTR_FORECAST_TEMP_LOW: tempmin,
-                ATTR_FORECAST_PRECIPITATION: precip,
-                ATTR_WEATHERBIT_SNOW: snow,
-                ATTR_WEATHERBIT_CLOUDINESS: getattr(
-                    self.fcst_coordinator.data[self._index], "clouds"
-                ),
-                ATTR_WEATHERBIT_FCST_POP: getattr(
-                    self.fcst_coordinator.data[self._index], "pop"
-                ),
-                ATTR_FORECAST_WIND_SPEED: wspeed,
-                ATTR_FORECAST_WIND_BEARING: getattr(
-                    self.fcst_coordinator.data[self._index], "wind_dir"
-                ),
-                ATTR_WEATHERBIT_WEATHER_TEXT: getattr(
-                    self.fcst_coordinator.data[self._index], "weather_text"
-                ),
-                ATTR_WEATHERBIT_WEATHER_ICON: getattr(
-                    self.fcst_coordinator.data[self._index], "weather_icon"
-                ),
-            }
+        return {
+            ATTR_ATTRIBUTION: DEFAULT_ATTRIBUTION,
+            ATTR_WEATHERBIT_ALERTS: self.alerts,
+        }
@@ -40,6 +40,9 @@ from .const import (
     ATTR_WEATHERBIT_SNOW,
     ATTR_WEATHERBIT_UPDATED,
     DEFAULT_ATTRIBUTION,
+    MM_TO_INCH,
+    MS_TO_KMH,
+    MS_TO_MPH,
     DEVICE_TYPE_WEATHER,
     CONDITION_CLASSES,
     ALT_CONDITION_CLASSES,
@@ -111,9 +114,9 @@ class WeatherbitWeather(WeatherbitEntity, WeatherEntity):
         """Return the wind speed."""
         speed_m_s = self._current.wind_spd
         if self._is_metric or speed_m_s is None:
-            return round(float(speed_m_s) * 3.6, 1)
+            return round(speed_m_s * MS_TO_KMH, 1)
 
-        return round(float(speed_m_s * 2.23693629), 2)
+        return round(speed_m_s * MS_TO_MPH, 2)
 
     @property
     def wind_gust(self) -> float:
@@ -122,7 +125,7 @@ class WeatherbitWeather(WeatherbitEntity, WeatherEntity):
         if self._is_metric or speed_m_s is None:
             return round(speed_m_s, 1)
 
-        return round(float(speed_m_s * 2.23693629), 2)
+        return round(speed_m_s * MS_TO_MPH, 2)
 
     @property
     def wind_bearing(self) -> int:
@@ -135,15 +138,15 @@ class WeatherbitWeather(WeatherbitEntity, WeatherEntity):
     def precipitation(self) -> float:
         """Return the precipitation."""
         if self._is_metric or self._current.precip is None:
-            return round(float(self._current.precip), 1)
+            return round(self._current.precip, 1)
 
-        return round(float(self._current.precip) / 25.4, 2)
+        return round(self._current.precip * MM_TO_INCH, 2)
 
     @property
     def ozone(self) -> float:
         """Return the ozone."""
         if self._forecast is not None:
-            return round(float(self._forecast.ozone), 1)
+            return round(self._forecast.ozone, 1)
         return None
 
     @property
@@ -228,7 +231,7 @@ class WeatherbitWeather(WeatherbitEntity, WeatherEntity):
         return DEFAULT_ATTRIBUTION
 
     @property
-    def device_state_attributes(self) -> Dict:
+    def extra_state_attributes(self) -> Dict:
         """Return Weatherbit specific attributes."""
         return {
             ATTR_WEATHERBIT_AQI: self.aqi,
@@ -257,21 +260,21 @@ class WeatherbitWeather(WeatherbitEntity, WeatherEntity):
 
             # Convert Wind Speed
             if self._is_metric or forecast.wind_spd is None:
-                wspeed = round(float(forecast.wind_spd) * 3.6, 1)
+                wspeed = round(forecast.wind_spd * MS_TO_KMH, 1)
             else:
-                wspeed = round(float(forecast.wind_spd * 2.23693629), 1)
+                wspeed = round(forecast.wind_spd * MS_TO_MPH, 1)
 
             # Convert Precipitation
             if self._is_metric or forecast.precip is None:
                 precip = round(forecast.precip, 1)
             else:
-                precip = round(float(forecast.precip) / 25.4, 2)
+                precip = round(forecast.precip * MM_TO_INCH, 2)
 
             # Convert Snowfall
             if self._is_metric or forecast.snow is None:
                 snow = round(forecast.snow, 1)
             else:
-                snow = round(float(forecast.snow) / 25.4, 2)
+                snow = round(forecast.snow * MM_TO_INCH, 2)
 
             data.append(
                 {